@@ -1,5 +1,5 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
@@ -17,6 +17,7 @@ class ConvolutionGUI:
         
         self.theme = tk.StringVar(value="dark")
         self.setup_themes()
+        self.setup_q_formats()
         
         self.mode = tk.StringVar(value="discrete")
         self.input_signal = None
@@ -25,7 +26,13 @@ class ConvolutionGUI:
         self.impulse_indices = None
         self.output_signal = None
         self.output_indices = None
+        self.dft_plans = {}
+        self.max_dft_plans = 4
+        self.max_dft_length = 2 ** 24
+        self.fixed_point_result = None
+        self.spectrum_axes = []
         self.animation_running = False
+        self.animation_thread = None
         self.animation_speed = 150
         self.animation_quality = tk.StringVar(value="high")
         
@@ -56,6 +63,23 @@ class ConvolutionGUI:
             }
         }
         
+    def setup_q_formats(self):
+        # Cycles per MAC are rough ATmega328P (Arduino Uno, 16 MHz) figures for the
+        # exported C kernel: 16x16->32 needs four 8-bit MULs, 32x32->64 is a library call
+        self.avr_clock_hz = 16000000
+        self.q_formats = {
+            "Q15": {
+                "frac_bits": 15, "dtype": np.int16, "acc_dtype": np.int32,
+                "c_type": "int16_t", "c_acc": "int32_t", "c_uacc": "uint32_t", "c_wide": "int64_t",
+                "c_uwide": "uint64_t", "c_pgm_read": "pgm_read_word", "avr_cycles_per_mac": 30
+            },
+            "Q31": {
+                "frac_bits": 31, "dtype": np.int32, "acc_dtype": np.int64,
+                "c_type": "int32_t", "c_acc": "int64_t", "c_uacc": "uint64_t", "c_wide": "int64_t",
+                "c_uwide": "uint64_t", "c_pgm_read": "pgm_read_dword", "avr_cycles_per_mac": 180
+            }
+        }
+        
     def setup_styles(self):
         self.style = ttk.Style()
         self.style.theme_use('clam')
@@ -76,7 +100,7 @@ class ConvolutionGUI:
         
         if hasattr(self, 'fig'):
             self.fig.patch.set_facecolor(current_theme["plot_bg"])
-            for ax in [self.ax1, self.ax2, self.ax3]:
+            for ax in [self.ax1, self.ax2, self.ax3] + self.spectrum_axes:
                 ax.set_facecolor(current_theme["plot_bg"])
                 ax.tick_params(colors=current_theme["plot_fg"])
                 ax.xaxis.label.set_color(current_theme["plot_fg"])
@@ -167,6 +191,43 @@ class ConvolutionGUI:
         
         ttk.Label(self.impulse_card, text="⚡ Impulse Response Setup", style='Title.TLabel').pack(anchor=tk.W)
         
+        conv_type_card = ttk.Frame(self.left_panel, style='Card.TFrame', padding=10)
+        conv_type_card.pack(fill=tk.X, pady=(0, 10))
+        
+        ttk.Label(conv_type_card, text="🧮 Convolution Type", style='Title.TLabel').pack(anchor=tk.W)
+        
+        conv_type_frame = tk.Frame(conv_type_card, bg=self.themes[self.theme.get()]["card_bg"])
+        conv_type_frame.pack(fill=tk.X, pady=(5, 0))
+        
+        ttk.Label(conv_type_frame, text="🔁 Type:", style='Heading.TLabel').pack(anchor=tk.W)
+        self.conv_type_combo, self.conv_type_var = self.create_custom_combobox(
+            conv_type_frame, ["linear", "circular", "fixed-point"], "linear")
+        
+        # Blank N means max(len(x), len(h)); shorter signals are zero-padded, longer ones wrapped
+        ttk.Label(conv_type_frame, text="📏 DFT Length N (blank = auto):", style='Heading.TLabel').pack(anchor=tk.W)
+        self.dft_length_entry = self.create_custom_entry(conv_type_frame)
+        
+        ttk.Label(conv_type_frame, text="🔢 Q Format:", style='Heading.TLabel').pack(anchor=tk.W)
+        self.q_format_combo, self.q_format_var = self.create_custom_combobox(
+            conv_type_frame, list(self.q_formats), "Q15")
+        
+        ttk.Label(conv_type_frame, text="🎚️ Rounding:", style='Heading.TLabel').pack(anchor=tk.W)
+        self.rounding_combo, self.rounding_var = self.create_custom_combobox(
+            conv_type_frame, ["round", "truncate"], "round")
+        
+        ttk.Label(conv_type_frame, text="🧱 Overflow:", style='Heading.TLabel').pack(anchor=tk.W)
+        self.overflow_combo, self.overflow_var = self.create_custom_combobox(
+            conv_type_frame, ["saturate", "wrap"], "saturate")
+        
+        # L1-safe scales h by sum|h| so the output can never overflow; peak keeps more precision
+        ttk.Label(conv_type_frame, text="📐 Coefficient Scaling:", style='Heading.TLabel').pack(anchor=tk.W)
+        self.scaling_combo, self.scaling_var = self.create_custom_combobox(
+            conv_type_frame, ["L1-safe", "peak"], "L1-safe")
+        
+        self.export_btn = ttk.Button(conv_type_frame, text="💾 Export C Kernel",
+                                    command=self.export_fixed_point_kernel, style='Secondary.TButton')
+        self.export_btn.pack(fill=tk.X, pady=(5, 0))
+        
         animation_card = ttk.Frame(self.left_panel, style='Card.TFrame', padding=10)
         animation_card.pack(fill=tk.X, pady=(0, 10))
         
@@ -218,11 +279,31 @@ class ConvolutionGUI:
         tk.Label(plot_header, text="📊 Real-time Signal Visualization", font=('Segoe UI', 16, 'bold'),
                 bg=self.themes[self.theme.get()]["bg"], fg=self.themes[self.theme.get()]["accent"]).pack(anchor=tk.W)
         
-        self.fig, (self.ax1, self.ax2, self.ax3) = plt.subplots(3, 1, figsize=(10, 12))
+        self.fig = plt.figure(figsize=(10, 12))
         self.fig.patch.set_facecolor(self.themes[self.theme.get()]["plot_bg"])
+        self.setup_axes(spectral=False)
+        
+        canvas_frame = tk.Frame(plot_panel, bg=self.themes[self.theme.get()]["bg"], relief='solid', bd=2)
+        canvas_frame.pack(fill=tk.BOTH, expand=True)
+        
+        self.canvas = FigureCanvasTkAgg(self.fig, canvas_frame)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        self.on_mode_change()
+        
+    def setup_axes(self, spectral):
+        # Circular mode adds magnitude and phase columns next to the time-domain plots
+        self.fig.clear()
+        if spectral:
+            axes = self.fig.subplots(3, 3, gridspec_kw={'width_ratios': [2, 1, 1]})
+            self.ax1, self.ax2, self.ax3 = axes[:, 0]
+            self.spectrum_axes = list(axes[:, 1:].ravel())
+        else:
+            self.ax1, self.ax2, self.ax3 = self.fig.subplots(3, 1)
+            self.spectrum_axes = []
         self.fig.tight_layout(pad=4.0)
         
-        for i, ax in enumerate([self.ax1, self.ax2, self.ax3]):
+        for i, ax in enumerate([self.ax1, self.ax2, self.ax3] + self.spectrum_axes):
             ax.set_facecolor(self.themes[self.theme.get()]["plot_bg"])
             ax.spines['top'].set_color(self.themes[self.theme.get()]["accent"])
             ax.spines['bottom'].set_color(self.themes[self.theme.get()]["accent"])
@@ -232,15 +313,7 @@ class ConvolutionGUI:
             ax.spines['bottom'].set_linewidth(2)
             ax.spines['left'].set_linewidth(2)
             ax.spines['right'].set_linewidth(2)
-        
-        canvas_frame = tk.Frame(plot_panel, bg=self.themes[self.theme.get()]["bg"], relief='solid', bd=2)
-        canvas_frame.pack(fill=tk.BOTH, expand=True)
-        
-        self.canvas = FigureCanvasTkAgg(self.fig, canvas_frame)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        self.on_mode_change()
-        
+            
     def create_custom_entry(self, parent, placeholder="", default_value=""):
         frame = tk.Frame(parent, bg=self.themes[self.theme.get()]["card_bg"])
         frame.pack(fill=tk.X, pady=(2, 5))
@@ -396,7 +469,19 @@ class ConvolutionGUI:
             messagebox.showerror("❌ Error", f"Invalid input: {str(e)}")
             return False
             
+    def run_after_animation(self, callback):
+        # The animation thread redraws ax2/ax3 and reads output_signal every frame,
+        # so axes and signals are only replaced once it has actually exited
+        self.animation_running = False
+        if self.animation_thread is not None and self.animation_thread.is_alive():
+            self.root.after(20, lambda: self.run_after_animation(callback))
+            return
+        callback()
+        
     def compute_convolution(self):
+        self.run_after_animation(self.start_convolution)
+        
+    def start_convolution(self):
         if self.mode.get() == "discrete":
             if not self.parse_discrete_signals():
                 return
@@ -404,6 +489,16 @@ class ConvolutionGUI:
             if not self.parse_continuous_signals():
                 return
                 
+        if self.conv_type_var.get() == "circular":
+            self.compute_circular_convolution()
+            return
+        if self.conv_type_var.get() == "fixed-point":
+            self.compute_fixed_point_convolution()
+            return
+            
+        if self.spectrum_axes:
+            self.setup_axes(spectral=False)
+            
         if self.mode.get() == "discrete":
             self.output_signal = np.convolve(self.input_signal, self.impulse_response, mode='full')
             self.output_indices = np.arange(
@@ -420,7 +515,361 @@ class ConvolutionGUI:
             
         self.animate_convolution_enhanced()
         
+    def resolve_dft_length(self):
+        text = self.dft_length_entry.get().strip()
+        if not text:
+            return max(len(self.input_signal), len(self.impulse_response))
+        n = int(text)
+        if n < 1:
+            raise ValueError("N must be a positive integer")
+        if n > self.max_dft_length:
+            raise ValueError(f"N must not exceed {self.max_dft_length}")
+        return n
+        
+    def get_dft_plan(self, n):
+        # Per-length rFFT setup is cached so repeated runs at the same N skip it;
+        # only the most recent few lengths are kept since each entry is O(N)
+        plan = self.dft_plans.pop(n, None)
+        if plan is None:
+            plan = {"freqs": np.fft.rfftfreq(n), "positions": np.arange(n)}
+            while len(self.dft_plans) >= self.max_dft_plans:
+                self.dft_plans.pop(next(iter(self.dft_plans)))
+        self.dft_plans[n] = plan
+        return plan
+        
+    def fit_to_length(self, signal, n):
+        # Zero-pad short sequences; wrap (time-alias) longer ones modulo N
+        if len(signal) <= n:
+            return np.pad(signal, (0, n - len(signal)))
+        return np.bincount(np.arange(len(signal)) % n, weights=signal, minlength=n)
+        
+    def thin_for_plot(self, x, y, max_points=4000):
+        # Drawing a million points per axis stalls Tk, so plot the min/max envelope
+        # of each bucket; a plain stride would skip narrow spectral peaks entirely
+        if len(y) <= max_points:
+            return x, y
+        step = int(np.ceil(len(y) / (max_points // 2)))
+        pad = (-len(y)) % step
+        buckets = np.pad(y, (0, pad), mode='edge').reshape(-1, step)
+        envelope = np.column_stack([buckets.min(axis=1), buckets.max(axis=1)]).ravel()
+        return np.repeat(x[::step], 2), envelope
+        
+    def compute_circular_convolution(self):
+        start_time = time.perf_counter()
+        try:
+            n = self.resolve_dft_length()
+            plan = self.get_dft_plan(n)
+            x = self.fit_to_length(self.input_signal, n)
+            h = self.fit_to_length(self.impulse_response, n)
+            
+            # N-point circular convolution is pointwise multiplication of the N-point DFTs
+            x_spectrum = np.fft.rfft(x)
+            h_spectrum = np.fft.rfft(h)
+            y_spectrum = x_spectrum * h_spectrum
+            output_signal = np.fft.irfft(y_spectrum, n)
+        except (ValueError, MemoryError) as e:
+            messagebox.showerror("❌ Error", f"Invalid DFT length: {str(e) or type(e).__name__}")
+            return
+        self.output_signal = output_signal
+        
+        if self.mode.get() == "discrete":
+            step = 1
+            freqs = plan["freqs"]
+        else:
+            step = self.input_indices[1] - self.input_indices[0]
+            self.output_signal *= step
+            y_spectrum = y_spectrum * step
+            freqs = plan["freqs"] / step
+            
+        x_indices = self.input_indices[0] + plan["positions"] * step
+        h_indices = self.impulse_indices[0] + plan["positions"] * step
+        self.output_indices = self.input_indices[0] + self.impulse_indices[0] + plan["positions"] * step
+        
+        elapsed = time.perf_counter() - start_time
+        self.draw_dft_analysis(n, freqs, [
+            ("Input x", x_indices, x, x_spectrum, "accent"),
+            ("Impulse h", h_indices, h, h_spectrum, "secondary"),
+            ("Output y", self.output_indices, self.output_signal, y_spectrum, "success"),
+        ], elapsed)
+        
+    def draw_dft_analysis(self, n, freqs, rows, elapsed):
+        if not self.spectrum_axes:
+            self.setup_axes(spectral=True)
+            
+        current_theme = self.themes[self.theme.get()]
+        linear_length = len(self.input_signal) + len(self.impulse_response) - 1
+        if n >= linear_length:
+            note = f"N={n} ≥ L+M−1={linear_length}: equals linear convolution"
+        else:
+            note = f"N={n} < L+M−1={linear_length}: time-aliased"
+            
+        time_axes = [self.ax1, self.ax2, self.ax3]
+        mag_axes = self.spectrum_axes[0::2]
+        phase_axes = self.spectrum_axes[1::2]
+        marker = 'o' if n <= 64 else None
+        
+        for (label, indices, values, spectrum, color_key), time_ax, mag_ax, phase_ax in zip(
+                rows, time_axes, mag_axes, phase_axes):
+            color = current_theme[color_key]
+            
+            time_ax.clear()
+            self.setup_enhanced_plot(time_ax, f"{label}[n] ({n}-point)")
+            plot_x, plot_y = self.thin_for_plot(indices, values)
+            time_ax.plot(plot_x, plot_y, color=color, linewidth=2, marker=marker)
+            
+            mag_ax.clear()
+            self.setup_enhanced_plot(mag_ax, f"|{label[-1].upper()}[k]|")
+            mag_ax.set_xlabel('Frequency', fontsize=12, color=current_theme["plot_fg"])
+            mag_ax.set_ylabel('Magnitude', fontsize=12, color=current_theme["plot_fg"])
+            plot_f, plot_mag = self.thin_for_plot(freqs, np.abs(spectrum))
+            mag_ax.plot(plot_f, plot_mag, color=color, linewidth=2, marker=marker)
+            
+            phase_ax.clear()
+            self.setup_enhanced_plot(phase_ax, f"∠{label[-1].upper()}[k]")
+            phase_ax.set_xlabel('Frequency', fontsize=12, color=current_theme["plot_fg"])
+            phase_ax.set_ylabel('Phase (rad)', fontsize=12, color=current_theme["plot_fg"])
+            plot_f, plot_phase = self.thin_for_plot(freqs, np.angle(spectrum))
+            phase_ax.plot(plot_f, plot_phase, color=color, linewidth=2, marker=marker)
+            
+        self.ax3.text(0.02, 0.98, f"{note}\nDFT path: {elapsed * 1000:.1f} ms",
+                     transform=self.ax3.transAxes, fontsize=10,
+                     verticalalignment='top',
+                     bbox=dict(boxstyle="round,pad=0.3",
+                              facecolor=current_theme["card_bg"],
+                              alpha=0.8))
+        
+        self.canvas.draw()
+        
+    def block_exponent(self, peak):
+        # Smallest power of two that brings peak strictly below 1.0
+        if peak <= 0:
+            return 0
+        return int(np.floor(np.log2(peak))) + 1
+        
+    def quantise(self, values, q_format, rounding):
+        scaled = values * 2.0 ** q_format["frac_bits"]
+        scaled = np.floor(scaled + 0.5) if rounding == "round" else np.floor(scaled)
+        info = np.iinfo(q_format["dtype"])
+        return np.clip(scaled, info.min, info.max).astype(q_format["dtype"])
+        
+    def fixed_point_convolve(self, x_q, h_q, q_format, rounding, overflow):
+        frac_bits = q_format["frac_bits"]
+        acc_bits = np.iinfo(q_format["acc_dtype"]).bits
+        
+        # Split x into high and low 16-bit halves so both partial sums stay exact in
+        # int64 (Q31 products alone reach 2^62); valid while taps < 2^16
+        x_wide = x_q.astype(np.int64)
+        h_wide = h_q.astype(np.int64)
+        high = np.convolve(x_wide >> 16, h_wide, mode='full')
+        low = np.convolve(x_wide & 0xFFFF, h_wide, mode='full')
+        
+        # Exact sum = top * 2^16 + (low & 0xFFFF), so the accumulator range check is on top alone
+        top = high + (low >> 16)
+        limit = 1 << (acc_bits - 1 - 16)
+        acc_overflows = int(np.count_nonzero((top < -limit) | (top >= limit)))
+        
+        # Recombining in int64 wraps like a two's-complement accumulator, so narrowing to
+        # the accumulator width gives the same bits as the exported C loop
+        acc = (high << 16) + low
+        acc = acc.astype(q_format["acc_dtype"]).astype(np.int64)
+        
+        if rounding == "round":
+            acc = acc + (1 << (frac_bits - 1))
+        shifted = acc >> frac_bits
+        
+        info = np.iinfo(q_format["dtype"])
+        output_clips = int(np.count_nonzero((shifted < info.min) | (shifted > info.max)))
+        if overflow == "saturate":
+            shifted = np.clip(shifted, info.min, info.max)
+        return shifted.astype(q_format["dtype"]), acc_overflows, output_clips
+        
+    def compute_fixed_point_convolution(self):
+        if self.spectrum_axes:
+            self.setup_axes(spectral=False)
+            
+        if len(self.impulse_response) >= 2 ** 16:
+            messagebox.showerror("❌ Error", "Fixed-point mode supports fewer than 65536 taps")
+            return
+            
+        q_format = self.q_formats[self.q_format_var.get()]
+        rounding = self.rounding_var.get()
+        overflow = self.overflow_var.get()
+        frac_scale = 2.0 ** q_format["frac_bits"]
+        
+        x_exp = self.block_exponent(np.max(np.abs(self.input_signal)))
+        if self.scaling_var.get() == "L1-safe":
+            h_exp = self.block_exponent(np.sum(np.abs(self.impulse_response)))
+        else:
+            h_exp = self.block_exponent(np.max(np.abs(self.impulse_response)))
+            
+        x_q = self.quantise(self.input_signal / 2.0 ** x_exp, q_format, rounding)
+        h_q = self.quantise(self.impulse_response / 2.0 ** h_exp, q_format, rounding)
+        
+        start_time = time.perf_counter()
+        y_q, acc_overflows, output_clips = self.fixed_point_convolve(x_q, h_q, q_format, rounding, overflow)
+        elapsed = time.perf_counter() - start_time
+        
+        self.output_signal = np.convolve(self.input_signal, self.impulse_response, mode='full')
+        fixed_output = y_q / frac_scale * 2.0 ** (x_exp + h_exp)
+        if self.mode.get() == "discrete":
+            step = 1
+        else:
+            step = self.input_indices[1] - self.input_indices[0]
+            self.output_signal *= step
+            fixed_output *= step
+        self.output_indices = self.input_indices[0] + self.impulse_indices[0] + np.arange(len(self.output_signal)) * step
+        
+        error = fixed_output - self.output_signal
+        error_power = np.sum(error ** 2)
+        signal_power = np.sum(self.output_signal ** 2)
+        sqnr = np.inf if error_power == 0 else 10 * np.log10(signal_power / error_power)
+        
+        taps = len(h_q)
+        outputs_per_second = self.avr_clock_hz / (taps * q_format["avr_cycles_per_mac"])
+        
+        self.fixed_point_result = {
+            "q_name": self.q_format_var.get(), "q_format": q_format, "rounding": rounding,
+            "overflow": overflow, "h_q": h_q, "x_exp": x_exp, "h_exp": h_exp,
+            "outputs_per_second": outputs_per_second
+        }
+        
+        self.draw_fixed_point_analysis(x_q / frac_scale * 2.0 ** x_exp, h_q / frac_scale * 2.0 ** h_exp,
+                                       fixed_output, [
+            f"{self.q_format_var.get()} | {rounding} | {overflow} | x·2^{-x_exp}, h·2^{-h_exp}",
+            f"max |e| = {np.max(np.abs(error)):.3g}, RMS e = {np.sqrt(np.mean(error ** 2)):.3g}, SQNR = {sqnr:.1f} dB",
+            f"acc overflows = {acc_overflows}, output clips = {output_clips}",
+            f"int kernel: {elapsed * 1000:.1f} ms | est. AVR @16 MHz: {outputs_per_second:,.0f} outputs/s"
+        ])
+        
+    def draw_fixed_point_analysis(self, x_fixed, h_fixed, y_fixed, report_lines):
+        current_theme = self.themes[self.theme.get()]
+        marker = 'o' if len(self.output_signal) <= 64 else None
+        rows = [
+            (self.ax1, "Input Signal: Float vs Quantised", self.input_indices, self.input_signal, x_fixed, "accent"),
+            (self.ax2, "Impulse Response: Float vs Quantised", self.impulse_indices, self.impulse_response, h_fixed, "secondary"),
+            (self.ax3, "Convolution Output: Float vs Fixed-Point", self.output_indices, self.output_signal, y_fixed, "success"),
+        ]
+        
+        for ax, title, indices, float_values, fixed_values, color_key in rows:
+            ax.clear()
+            self.setup_enhanced_plot(ax, title)
+            plot_x, plot_float = self.thin_for_plot(indices, float_values)
+            _, plot_fixed = self.thin_for_plot(indices, fixed_values)
+            ax.plot(plot_x, plot_float, color=current_theme[color_key], linewidth=4, alpha=0.5, label='Float')
+            ax.plot(plot_x, plot_fixed, color=current_theme["warning"], linewidth=2,
+                    linestyle='--', marker=marker, markersize=4, label='Fixed-Point')
+            ax.legend()
+            
+        self.ax3.text(0.02, 0.98, "\n".join(report_lines),
+                     transform=self.ax3.transAxes, fontsize=10,
+                     verticalalignment='top',
+                     bbox=dict(boxstyle="round,pad=0.3",
+                              facecolor=current_theme["card_bg"],
+                              alpha=0.8))
+        
+        self.canvas.draw()
+        
+    def build_c_kernel(self, result):
+        q_format = result["q_format"]
+        frac_bits = q_format["frac_bits"]
+        c_type = q_format["c_type"]
+        c_acc = q_format["c_acc"]
+        c_uacc = q_format["c_uacc"]
+        c_wide = q_format["c_wide"]
+        c_uwide = q_format["c_uwide"]
+        taps = len(result["h_q"])
+        info = np.iinfo(q_format["dtype"])
+        # stdint limit macros avoid literals like -2147483648, which avr-gcc reads as unsigned
+        c_min = f"INT{info.bits}_MIN"
+        c_max = f"INT{info.bits}_MAX"
+        
+        coeffs = ",\n".join(
+            "    " + ", ".join(c_min if v == info.min else str(int(v)) for v in result["h_q"][i:i + 8])
+            for i in range(0, taps, 8))
+        
+        signed_acc = f"({c_acc})acc" if c_acc == c_wide else f"({c_wide})({c_acc})acc"
+        if result["rounding"] == "round":
+            round_expr = f"({c_wide})(({c_uwide}){signed_acc} + (({c_uwide})1 << {frac_bits - 1}))"
+        else:
+            round_expr = signed_acc
+        if result["overflow"] == "saturate":
+            store = (f"        if (r > {c_max}) r = {c_max};\n"
+                     f"        if (r < {c_min}) r = {c_min};\n"
+                     f"        y[n] = ({c_type})r;")
+        else:
+            store = f"        y[n] = ({c_type})r;"
+            
+        return f"""/* Fixed-point convolution kernel exported by Convolution Studio.
+ * Format: {result["q_name"]}, rounding: {result["rounding"]}, overflow: {result["overflow"]}
+ * Coefficients are h * 2^{-result["h_exp"]}; pre-scale x by 2^{-result["x_exp"]} for the analysed input.
+ * Real output = y * 2^({result["x_exp"] + result["h_exp"]} - {frac_bits}).
+ * Throughput estimate (ATmega328P @ {self.avr_clock_hz // 1000000} MHz, ~{q_format["avr_cycles_per_mac"]} cycles/MAC):
+ *   {taps} MACs per output -> ~{result["outputs_per_second"]:,.0f} outputs/s
+ *
+ * The accumulator is deliberately modular: sums are kept in {c_uacc} so overflow
+ * wraps mod 2^{np.iinfo(q_format["acc_dtype"]).bits} instead of being undefined, matching the Studio's bit-exact model.
+ * Converting back to signed and ">>" on negative values assume two's complement with an
+ * arithmetic shift, as gcc/avr-gcc implement them.
+ * On AVR the coefficient table stays in flash (PROGMEM) rather than SRAM.
+ */
+#include <stdint.h>
+
+#ifdef __AVR__
+#include <avr/pgmspace.h>
+#define CONV_COEFF(k) (({c_type}){q_format["c_pgm_read"]}(&conv_coeffs[k]))
+#else
+#define PROGMEM
+#define CONV_COEFF(k) (conv_coeffs[k])
+#endif
+
+#define CONV_TAPS {taps}
+#define CONV_FRAC_BITS {frac_bits}
+#define CONV_COEFF_EXP {result["h_exp"]}
+
+static const {c_type} conv_coeffs[CONV_TAPS] PROGMEM = {{
+{coeffs}
+}};
+
+/* Full linear convolution: y must hold x_len + CONV_TAPS - 1 samples. */
+void conv_{result["q_name"].lower()}(const {c_type} *x, uint32_t x_len, {c_type} *y)
+{{
+    for (uint32_t n = 0; n < x_len + CONV_TAPS - 1; n++) {{
+        {c_uacc} acc = 0;
+        for (uint32_t k = 0; k < CONV_TAPS; k++) {{
+            if (n >= k && n - k < x_len) {{
+                acc += ({c_uacc})(({c_acc})CONV_COEFF(k) * x[n - k]);
+            }}
+        }}
+        {c_wide} r = {round_expr} >> CONV_FRAC_BITS;
+{store}
+    }}
+}}
+"""
+        
+    def export_fixed_point_kernel(self):
+        if self.fixed_point_result is None:
+            messagebox.showerror("❌ Error", "Run a fixed-point convolution before exporting")
+            return
+            
+        path = filedialog.asksaveasfilename(defaultextension=".h",
+                                            filetypes=[("C header", "*.h"), ("All files", "*.*")])
+        if not path:
+            return
+            
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(self.build_c_kernel(self.fixed_point_result))
+        except Exception as e:
+            messagebox.showerror("❌ Error", f"Export failed: {str(e)}")
+            return
+            
+        messagebox.showinfo("💾 Exported", f"Kernel written to {path}\n"
+                            f"Estimated throughput: {self.fixed_point_result['outputs_per_second']:,.0f} outputs/s")
+        
     def compute_correlation(self):
+        self.run_after_animation(self.start_correlation)
+        
+    def start_correlation(self):
         if self.mode.get() == "discrete":
             if not self.parse_discrete_signals():
                 return
@@ -442,6 +891,8 @@ class ConvolutionGUI:
             corr_end = corr_start + len(correlation) * dt
             corr_indices = np.arange(corr_start, corr_end, dt)[:len(correlation)]
             
+        if self.spectrum_axes:
+            self.setup_axes(spectral=False)
         self.ax3.clear()
         self.setup_enhanced_plot(self.ax3, "📊 Correlation Result")
         
@@ -666,7 +1117,11 @@ class ConvolutionGUI:
         
 
     def reset_all(self):
-        self.animation_running = False
+        self.run_after_animation(self.clear_all)
+        
+    def clear_all(self):
+        if self.spectrum_axes:
+            self.setup_axes(spectral=False)
         for ax in [self.ax1, self.ax2, self.ax3]:
             ax.clear()
             self.setup_enhanced_plot(ax, "Ready for New Signals")
@@ -675,6 +1130,7 @@ class ConvolutionGUI:
         self.input_signal = None
         self.impulse_response = None
         self.output_signal = None
+        self.fixed_point_result = None
         self.current_frame = 0
         self.total_frames = 0
         self.particle_effects = []